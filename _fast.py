@@ -0,0 +1,55 @@
+"""
+Numeric kernels for the negotiation tracker
+
+The kernels are JIT-compiled with numba when it is installed; otherwise the
+same functions run as plain Python. Callers pass NumPy views of the tracker's
+price column.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def _stalemate_kernel(prices, window, threshold):
+    """
+    Return True if the last `window` prices vary by no more than `threshold`
+    (as a fraction of the highest price in the window)
+    """
+    n = prices.shape[0]
+    if n < window:
+        return False
+    if window < 2:
+        return False
+
+    # Running min/max over the window in a single pass
+    lo = prices[n - 1]
+    hi = lo
+    for i in range(n - window, n - 1):
+        p = prices[i]
+        if p < lo:
+            lo = p
+        if p > hi:
+            hi = p
+
+    if hi == 0:
+        return False
+
+    return (hi - lo) / hi <= threshold
+
+
+if HAVE_NUMBA:
+    # Compile (or load from the on-disk cache) at import; negotiation_sim
+    # imports this module on the first non-default-window stalemate query
+    _stalemate_kernel(np.zeros(1), 5, 0.02)
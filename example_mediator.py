@@ -12,7 +12,11 @@ from negotiation_sim import (
     plot_negotiation_path,
     BuyerAgent,
     SellerAgent,
-    MediatorAgent
+    MediatorAgent,
+    split_the_difference,
+    BUYER_ID,
+    SELLER_ID,
+    MEDIATOR_ID
 )
 
 
@@ -45,14 +49,14 @@ def main():
     
     # Round 1-3: Agents get close
     offers = [
-        ("Buyer_Agent", 428.0, "Initial offer near middle ground"),
-        ("Seller_Agent", 432.0, "Counter-offer with small gap"),
-        ("Buyer_Agent", 429.0, "Small increment"),
-        ("Seller_Agent", 431.0, "Small decrement"),
-        ("Buyer_Agent", 429.5, "Tiny increment - stalemate forming"),
-        ("Seller_Agent", 430.5, "Tiny decrement - stalemate forming"),
-        ("Buyer_Agent", 429.8, "Another tiny increment"),
-        ("Seller_Agent", 430.2, "Another tiny decrement"),
+        (BUYER_ID, 428.0, "Initial offer near middle ground"),
+        (SELLER_ID, 432.0, "Counter-offer with small gap"),
+        (BUYER_ID, 429.0, "Small increment"),
+        (SELLER_ID, 431.0, "Small decrement"),
+        (BUYER_ID, 429.5, "Tiny increment - stalemate forming"),
+        (SELLER_ID, 430.5, "Tiny decrement - stalemate forming"),
+        (BUYER_ID, 429.8, "Another tiny increment"),
+        (SELLER_ID, 430.2, "Another tiny decrement"),
     ]
     
     for i, (agent, price, reasoning) in enumerate(offers, 1):
@@ -77,25 +81,20 @@ def main():
             print("Analysis:")
             print(f"  - Rounds without progress: {i}")
             print(f"  - Price change over last 5 rounds: <2%")
-            print(f"  - Current gap: ${abs(offers[i-1][1] - offers[i-2][1]):.2f}")
+            prev_price, last_price = tracker.get_last_prices(2)
+            print(f"  - Current gap: ${abs(last_price - prev_price):.2f}")
             print()
             
             # Get last buyer and seller prices
-            last_buyer_price = next(
-                (o[1] for o in reversed(offers[:i]) if "Buyer" in o[0]),
-                429.8
-            )
-            last_seller_price = next(
-                (o[1] for o in reversed(offers[:i]) if "Seller" in o[0]),
-                430.2
-            )
+            last_buyer_price = tracker.last_price_by_role[BUYER_ID]
+            last_seller_price = tracker.last_price_by_role[SELLER_ID]
             
             print("Mediator Intervention:")
             print(f"  Last Buyer offer: ${last_buyer_price}")
             print(f"  Last Seller offer: ${last_seller_price}")
             
             # Calculate compromise
-            compromise = (last_buyer_price + last_seller_price) / 2
+            compromise = split_the_difference(last_buyer_price, last_seller_price)
             print(f"  Proposed compromise: ${compromise:.2f}")
             print()
             
@@ -107,9 +106,9 @@ def main():
                           f"This is exactly halfway between your positions and ensures fairness.",
                 is_final_offer=False
             )
-            tracker.add_offer("Mediator_Agent", mediator_offer)
+            tracker.add_offer(MEDIATOR_ID, mediator_offer)
             
-            print(f"Round {i+1}: Mediator_Agent")
+            print(f"Round {i+1}: {MEDIATOR_ID}")
             print(f"  Price: ${compromise:.2f}")
             print(f"  Reasoning: {mediator_offer.reasoning}")
             print()
@@ -130,7 +129,8 @@ def main():
             print()
             
             # Generate visualization
-            plot_negotiation_path(tracker, "mediator_example.png")
+            # Wait for the background write so the message below holds
+            plot_negotiation_path(tracker, "mediator_example.png").result()
             print("📊 Visualization saved to: mediator_example.png")
             print()
             